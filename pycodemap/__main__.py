@@ -4,11 +4,16 @@ The command line interface of the pycodemap tool.
 This module provides the command line interface for the pycodemap tool.
 """
 
-import argparse
 import fnmatch
+import itertools
 import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 
-from pycodemap.analyzer import analyze_file
+from pycodemap.analyzer import analyze_file, read_file_bytes
 from pycodemap.formatter import format_output
 
 DEFAULT_IGNORES = {".git", ".venv*", "__pycache__", "*.egg-info", "build", "dist"}
@@ -21,6 +26,102 @@ directories, virtual environments, Python bytecode cache directories,
 package build directories, and egg-info directories.
 """
 
+PARALLEL_MIN_FILES = 32
+"""
+The minimum number of files for which analysis is dispatched to a process
+pool. Below this, the cost of starting worker processes outweighs the
+parallel parsing they provide, so files are analyzed in-process.
+"""
+
+PREFETCH_FILES = 8
+"""
+How many files the in-process path reads ahead of the parser. Bounded so
+a large tree is never pulled into memory faster than it is analyzed.
+"""
+
+
+def _prefetch_bytes(filepaths):
+    """
+    Yields (filepath, data) pairs in order, reading a bounded window of
+    files ahead on background threads so the parser does not wait on disk.
+
+    Args:
+        filepaths (list): The paths to read.
+
+    Yields:
+        tuple: The next path and its raw contents.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        remaining = iter(filepaths)
+        pending = deque(
+            (filepath, executor.submit(read_file_bytes, filepath))
+            for filepath in itertools.islice(remaining, PREFETCH_FILES)
+        )
+        while pending:
+            filepath, future = pending.popleft()
+            yield filepath, future.result()
+            for next_path in itertools.islice(remaining, 1):
+                pending.append((next_path, executor.submit(read_file_bytes, next_path)))
+
+
+def _iter_python_files(directory, is_ignored):
+    """
+    Yields the paths of all Python files under a directory, skipping
+    ignored names, in the same top-down order os.walk would produce.
+
+    Built on os.scandir: the entry type comes back from the directory
+    read itself, so no per-entry stat call is needed. Unreadable
+    directories are skipped silently, as os.walk does.
+
+    Args:
+        directory (str): The directory to traverse.
+        is_ignored (callable): Predicate for names to skip.
+
+    Yields:
+        str: The path of the next Python file.
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    subdirectories = []
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if is_ignored(name):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif name.endswith(".py"):
+                yield entry.path
+    for subdirectory in subdirectories:
+        yield from _iter_python_files(subdirectory, is_ignored)
+
+
+def _build_ignore_matcher(ignore_patterns):
+    """
+    Builds a predicate that tells whether a directory or file name matches
+    one of the ignore patterns.
+
+    Patterns without wildcard characters (the common case) are checked with
+    a single frozenset lookup; only genuine wildcard patterns go through a
+    combined regular expression.
+
+    Args:
+        ignore_patterns (set): The fnmatch-style patterns to match against.
+
+    Returns:
+        callable: A function mapping a name to a truthy value when ignored.
+    """
+    literals = frozenset(p for p in ignore_patterns if not any(ch in p for ch in "*?["))
+    wildcards = [p for p in ignore_patterns if p not in literals]
+    if not wildcards:
+        return literals.__contains__
+    regex = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in wildcards))
+    if not literals:
+        return regex.match
+    return lambda name: name in literals or regex.match(name)
+
 
 def run():
     """
@@ -37,6 +138,8 @@ def run():
     :param output: Path to save the output to a file.
     :param ignore: Pattern of directories or files to ignore (e.g., '.git|__pycache__').
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="A tool to extract and outline the structure of Python code."
     )
@@ -87,33 +190,48 @@ def run():
 
     output_file = open(args.output, "w", encoding="utf-8") if args.output else None
 
-    for root, dirs, files in os.walk(directory):
-        dirs[:] = [
-            d for d in dirs if not any(fnmatch.fnmatch(d, p) for p in ignore_patterns)
-        ]
-        for file in files:
-            if file.endswith(".py") and not any(
-                fnmatch.fnmatch(file, p) for p in ignore_patterns
-            ):
-                filepath = os.path.join(root, file)
-                classes, functions = analyze_file(
-                    filepath, include_classes, include_functions
-                )
-                result = format_output(
-                    filepath,
-                    classes,
-                    functions,
-                    include_classes,
-                    include_functions,
-                    args.minimalistic,
-                    args.no_attributes,
-                )
-                if result.strip():
-                    if output_file:
-                        output_file.write(result)
-                    else:
-                        print(result)
+    is_ignored = _build_ignore_matcher(ignore_patterns)
+
+    filepaths = list(_iter_python_files(directory, is_ignored))
+
+    analyze = partial(
+        analyze_file,
+        include_classes=include_classes,
+        include_functions=include_functions,
+    )
 
+    executor = None
+    if len(filepaths) >= PARALLEL_MIN_FILES:
+        executor = ProcessPoolExecutor()
+        summaries = executor.map(analyze, filepaths, chunksize=16)
+    else:
+        summaries = (
+            analyze(filepath, data=data)
+            for filepath, data in _prefetch_bytes(filepaths)
+        )
+
+    for filepath, (classes, functions) in zip(filepaths, summaries):
+        if not classes and not functions:
+            continue
+        result = format_output(
+            filepath,
+            classes,
+            functions,
+            include_classes,
+            include_functions,
+            args.minimalistic,
+            args.no_attributes,
+        )
+        if result:
+            if output_file:
+                # The final "\n" fragment corresponds to the newline print()
+                # used to add on stdout; --output files never had it.
+                output_file.writelines(result[:-1])
+            else:
+                sys.stdout.writelines(result)
+
+    if executor:
+        executor.shutdown()
     if output_file:
         output_file.close()
 
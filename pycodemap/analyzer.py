@@ -8,9 +8,130 @@ information about the classes and functions it contains.
 """
 
 import ast
+import hashlib
+import os
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+from pycodemap import cache
 
 DEFAULT_IGNORES = {".git", ".venv*", "__pycache__", "*.egg-info", "build", "dist"}
 
+Method = namedtuple("Method", ["name", "args", "args_str", "return_type", "decorators"])
+"""A summary of one function or method: its name, argument list with type
+hints, the argument list pre-rendered as a signature string, return type
+hint, and decorators."""
+
+Attribute = namedtuple("Attribute", ["name", "type"])
+"""A summary of one class attribute: its name and type hint, if any."""
+
+
+def _short_unparse(node: ast.AST) -> str:
+    """
+    Renders the simple AST nodes that make up almost all type hints and
+    decorators (names, attributes, constants, subscripts, unions) without
+    going through `ast.unparse`, which builds a full unparser visitor per
+    call. Unusual nodes fall back to `ast.unparse`.
+
+    Args:
+        node (ast.AST): The AST node to render.
+
+    Returns:
+        str: The source-like string representation of the node.
+    """
+    handler = _SHORT_UNPARSERS.get(type(node))
+    if handler is None:
+        return ast.unparse(node)
+    return handler(node)
+
+
+def _unparse_attribute(node: ast.Attribute) -> str:
+    return f"{_short_unparse(node.value)}.{node.attr}"
+
+
+def _unparse_constant(node: ast.Constant) -> str:
+    return "..." if node.value is Ellipsis else repr(node.value)
+
+
+def _unparse_subscript(node: ast.Subscript) -> str:
+    slice_node = node.slice
+    if type(slice_node) is ast.Tuple:
+        elements = slice_node.elts
+        if not elements:
+            inner = "()"
+        elif len(elements) == 1:
+            inner = f"{_short_unparse(elements[0])},"
+        else:
+            inner = ", ".join(_short_unparse(element) for element in elements)
+    else:
+        inner = _short_unparse(slice_node)
+    return f"{_short_unparse(node.value)}[{inner}]"
+
+
+def _unparse_binop(node: ast.BinOp) -> str:
+    if type(node.op) is ast.BitOr:
+        return f"{_short_unparse(node.left)} | {_short_unparse(node.right)}"
+    return ast.unparse(node)
+
+
+_SHORT_UNPARSERS = {
+    ast.Name: lambda node: node.id,
+    ast.Attribute: _unparse_attribute,
+    ast.Constant: _unparse_constant,
+    ast.Subscript: _unparse_subscript,
+    ast.BinOp: _unparse_binop,
+}
+
+
+_DECORATOR_CACHE = {}
+"""Rendered decorator strings keyed by `_decorator_key`, shared across files."""
+
+
+def _decorator_key(node: ast.AST):
+    """
+    Builds a hashable structural key for a decorator subtree, so that the
+    same decorator (`@staticmethod`, `@app.route("/")`, ...) appearing on
+    many functions is rendered only once per process. Returns None for
+    shapes that are not worth keying.
+
+    Args:
+        node (ast.AST): The decorator expression node.
+
+    Returns:
+        A hashable key describing the subtree, or None.
+    """
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Attribute:
+        value_key = _decorator_key(node.value)
+        if value_key is None:
+            return None
+        return ("attr", value_key, node.attr)
+    if node_type is ast.Constant:
+        # 1, 1.0, and True are equal (and hash alike) as dict keys, so the
+        # value alone would collapse distinct renderings onto one entry.
+        return ("const", type(node.value).__name__, node.value)
+    if node_type is ast.Call:
+        func_key = _decorator_key(node.func)
+        if func_key is None:
+            return None
+        arg_keys = []
+        for arg in node.args:
+            arg_key = _decorator_key(arg)
+            if arg_key is None:
+                return None
+            arg_keys.append(arg_key)
+        keyword_keys = []
+        for keyword in node.keywords:
+            value_key = _decorator_key(keyword.value)
+            if value_key is None:
+                return None
+            keyword_keys.append((keyword.arg, value_key))
+        return ("call", func_key, tuple(arg_keys), tuple(keyword_keys))
+    return None
+
 
 def get_arguments_and_hints(node: ast.FunctionDef) -> tuple:
     """
@@ -22,27 +143,34 @@ def get_arguments_and_hints(node: ast.FunctionDef) -> tuple:
 
     Returns:
         tuple: A tuple containing a list of tuples with argument names
-               and their type hints, and the return type hint.
+               and their type hints, the argument list rendered as a
+               signature string, and the return type hint.
                The argument list includes positional, *args, and **kwargs.
     """
     args_info = []
+    rendered = []
     for arg in node.args.args:
         arg_name = arg.arg
         arg_type = None
         if arg.annotation:
-            arg_type = ast.unparse(arg.annotation)
-        args_info.append((arg_name, arg_type))
+            arg_type = sys.intern(_short_unparse(arg.annotation))
+            rendered.append(f"{arg_name}: {arg_type}")
+        else:
+            rendered.append(arg_name)
+        args_info.append((sys.intern(arg_name), arg_type))
 
     if node.args.vararg:
         args_info.append((f"*{node.args.vararg.arg}", None))
+        rendered.append(f"*{node.args.vararg.arg}")
     if node.args.kwarg:
         args_info.append((f"**{node.args.kwarg.arg}", None))
+        rendered.append(f"**{node.args.kwarg.arg}")
 
     return_type = None
     if node.returns:
-        return_type = ast.unparse(node.returns)
+        return_type = sys.intern(_short_unparse(node.returns))
 
-    return args_info, return_type
+    return args_info, ", ".join(rendered), return_type
 
 
 def get_decorators(node: ast.FunctionDef) -> list:
@@ -57,60 +185,74 @@ def get_decorators(node: ast.FunctionDef) -> list:
     """
     decorators = []
     for decorator in node.decorator_list:
-        decorators.append(ast.unparse(decorator))
+        key = _decorator_key(decorator)
+        if key is None:
+            decorators.append(_short_unparse(decorator))
+            continue
+        rendered = _DECORATOR_CACHE.get(key)
+        if rendered is None:
+            rendered = sys.intern(_short_unparse(decorator))
+            _DECORATOR_CACHE[key] = rendered
+        decorators.append(rendered)
     return decorators
 
 
-def analyze_method(child: ast.FunctionDef) -> dict:
-    args, return_type = get_arguments_and_hints(child)
+def analyze_method(child: ast.FunctionDef) -> Method:
+    args, args_str, return_type = get_arguments_and_hints(child)
     method_decorators = get_decorators(child)
-    return {
-        "name": child.name,
-        "args": args,
-        "return_type": return_type,
-        "decorators": method_decorators,
-    }
+    # The body is never inspected; drop it so the subtree can be freed
+    # while the rest of the module is still being walked.
+    child.body.clear()
+    return Method(
+        sys.intern(child.name), args, args_str, return_type, method_decorators
+    )
 
 
-def analyze_assignments_without_annotations(child: ast.Assign) -> list[dict]:
+def analyze_assignments_without_annotations(child: ast.Assign) -> list[Attribute]:
     class_attributes_without_annotations = []
     for target in child.targets:
-        name = target.id if isinstance(target, ast.Name) else None
-        class_attributes_without_annotations.append({"name": name, "type": None})
+        name = sys.intern(target.id) if isinstance(target, ast.Name) else None
+        class_attributes_without_annotations.append(Attribute(name, None))
     return class_attributes_without_annotations
 
 
-def analyze_assignments_with_annotations(child: ast.AnnAssign) -> list[dict]:
+def analyze_assignments_with_annotations(child: ast.AnnAssign) -> list[Attribute]:
     class_attributes_with_annotations = []
-    name = child.target.id if isinstance(child.target, ast.Name) else None
-    annotation = ast.unparse(child.annotation) if child.annotation else None
-    class_attributes_with_annotations.append({"name": name, "type": annotation})
+    name = sys.intern(child.target.id) if isinstance(child.target, ast.Name) else None
+    annotation = sys.intern(ast.unparse(child.annotation)) if child.annotation else None
+    class_attributes_with_annotations.append(Attribute(name, annotation))
     return class_attributes_with_annotations
 
 
+_ATTRIBUTE_HANDLERS = {
+    ast.Assign: analyze_assignments_without_annotations,
+    ast.AnnAssign: analyze_assignments_with_annotations,
+}
+"""Class-body assignment nodes mapped to their attribute extractors."""
+
+
 def analyze_class(node: ast.ClassDef) -> dict:
     class_decorators = get_decorators(node)
     class_methods = []
     base_classes = [ast.unparse(base) for base in node.bases]
     class_attributes = []
 
+    function_def = ast.FunctionDef
+    get_attribute_handler = _ATTRIBUTE_HANDLERS.get
+    add_method = class_methods.append
+    add_attributes = class_attributes.extend
+
     for child in node.body:
-        if isinstance(child, ast.FunctionDef):
-            class_method = analyze_method(child)
-            class_methods.append(class_method)
-        if isinstance(child, ast.Assign):
-            class_attributes_without_annotations = (
-                analyze_assignments_without_annotations(child)
-            )
-            class_attributes.extend(class_attributes_without_annotations)
-        elif isinstance(child, ast.AnnAssign):
-            class_attributes_with_annotations = analyze_assignments_with_annotations(
-                child
-            )
-            class_attributes.extend(class_attributes_with_annotations)
+        child_type = type(child)
+        if child_type is function_def:
+            add_method(analyze_method(child))
+        else:
+            handler = get_attribute_handler(child_type)
+            if handler is not None:
+                add_attributes(handler(child))
 
     return {
-        "name": node.name,
+        "name": sys.intern(node.name),
         "decorators": class_decorators,
         "base_classes": base_classes,
         "methods": class_methods,
@@ -118,44 +260,139 @@ def analyze_class(node: ast.ClassDef) -> dict:
     }
 
 
-def analyze_function(node: ast.FunctionDef) -> dict:
-    args, return_type = get_arguments_and_hints(node)
+def analyze_function(node: ast.FunctionDef) -> Method:
+    args, args_str, return_type = get_arguments_and_hints(node)
     function_decorators = get_decorators(node)
-    return {
-        "name": node.name,
-        "args": args,
-        "return_type": return_type,
-        "decorators": function_decorators,
-    }
+    node.body.clear()
+    return Method(
+        sys.intern(node.name), args, args_str, return_type, function_decorators
+    )
 
 
-def analyze_file(
-    filepath: str, include_classes: bool = True, include_functions: bool = True
-) -> tuple:
+def _revive_summary(summary) -> tuple:
     """
-    Analyzes a Python file and extracts information about the classes and functions
-    it contains.
+    Rebuilds the record types of a summary deserialized from the cache,
+    where namedtuples come back as plain lists.
+    """
+    classes, functions = summary
+    for class_data in classes:
+        class_data["methods"] = [Method(*method) for method in class_data["methods"]]
+        class_data["attributes"] = [
+            Attribute(*attribute) for attribute in class_data["attributes"]
+        ]
+    functions = [Method(*function) for function in functions]
+    return classes, functions
+
+
+def read_file_bytes(filepath: str) -> bytes:
+    """
+    Reads the raw contents of a file.
+
+    Works on a raw file descriptor instead of a buffered file object:
+    one open, one fstat for the size, one read, one close. Python source
+    files almost always fit in a single read; a read that comes back
+    short is drained in a follow-up loop.
 
     Args:
-        filepath (str): The path to the Python file to analyze.
-        include_classes (bool): Whether to include classes in the output.
-        include_functions (bool): Whether to include functions in the output.
+        filepath (str): The path to the file to read.
 
     Returns:
-        tuple: A tuple containing two lists: the first list contains dictionaries
-            with information about the classes, and the second list contains
-            dictionaries with information about the functions.
+        bytes: The file contents.
+    """
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b""
+        if len(data) < size:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    return data
+
+
+def _analyze_data(filepath: str, data: bytes) -> tuple:
+    """
+    Produces the full (classes, functions) summary for the given file
+    contents, consulting and feeding the on-disk cache.
     """
-    with open(filepath, "r", encoding="utf-8") as file:
-        tree = ast.parse(file.read())
+    digest = hashlib.sha256(data).hexdigest()
+    summary = cache.load(digest)
+
+    if summary is not None:
+        return _revive_summary(summary)
+
+    tree = ast.parse(data, filename=filepath)
 
     classes = []
     functions = []
 
+    class_def = ast.ClassDef
+    function_def = ast.FunctionDef
+    add_class = classes.append
+    add_function = functions.append
+
     for node in tree.body:
-        if isinstance(node, ast.ClassDef) and include_classes:
-            classes.append(analyze_class(node))
-        elif isinstance(node, ast.FunctionDef) and include_functions:
-            functions.append(analyze_function(node))
+        node_type = type(node)
+        if node_type is class_def:
+            add_class(analyze_class(node))
+        elif node_type is function_def:
+            add_function(analyze_function(node))
 
+    cache.store(digest, [classes, functions])
     return classes, functions
+
+
+@lru_cache(maxsize=1024)
+def _analyze_path_cached(filepath: str, mtime_ns: int, size: int) -> tuple:
+    """
+    In-process memoization of per-file summaries for long-lived callers
+    (watchers, editor integrations) that analyze the same paths
+    repeatedly. mtime_ns and size only serve as part of the cache key:
+    when the file changes on disk, the stale entry stops matching.
+    """
+    return _analyze_data(filepath, read_file_bytes(filepath))
+
+
+def analyze_file(
+    filepath: str,
+    include_classes: bool = True,
+    include_functions: bool = True,
+    data: bytes = None,
+) -> tuple:
+    """
+    Analyzes a Python file and extracts information about the classes and functions
+    it contains.
+
+    Results are cached on disk keyed by a hash of the file contents, so a
+    file that has not changed since a previous run is not parsed again, and
+    memoized in-process keyed by (path, mtime, size), so re-analyzing an
+    unchanged path costs a stat call.
+
+    Args:
+        filepath (str): The path to the Python file to analyze.
+        include_classes (bool): Whether to include classes in the output.
+        include_functions (bool): Whether to include functions in the output.
+        data (bytes): The file contents, if the caller has already read them;
+            when omitted, the file is read from disk.
+
+    Returns:
+        tuple: A tuple containing two lists: the first list contains class
+            dictionaries, whose "methods" and "attributes" entries hold
+            Method and Attribute records, and the second list contains
+            Method records for the top-level functions.
+    """
+    if data is None:
+        stat = os.stat(filepath)
+        classes, functions = _analyze_path_cached(
+            filepath, stat.st_mtime_ns, stat.st_size
+        )
+    else:
+        classes, functions = _analyze_data(filepath, data)
+
+    return classes if include_classes else [], functions if include_functions else []
@@ -0,0 +1,84 @@
+"""
+Persistent on-disk cache of per-file analysis results.
+
+This module stores the classes/functions summary produced for a file, keyed
+by the SHA-256 hash of the file contents, so repeated runs over unchanged
+files skip parsing entirely. The cache lives in a small SQLite database
+under the user's cache directory and is shared by all invocations.
+
+"""
+
+import json
+import os
+import sqlite3
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pycodemap")
+CACHE_PATH = os.path.join(CACHE_DIR, "cache.db")
+
+_SCHEMA_VERSION = 4
+"""Bump whenever the shape of the cached summaries changes."""
+
+_connection = None
+_unavailable = False
+
+
+def _connect():
+    """
+    Returns the shared SQLite connection, creating the database on first
+    use. Returns None (and stops retrying) if the cache directory or the
+    database cannot be opened, so analysis degrades to uncached operation.
+    """
+    global _connection, _unavailable
+    if _connection is None and not _unavailable:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            _connection = sqlite3.connect(CACHE_PATH)
+            _connection.execute("PRAGMA journal_mode=WAL")
+            _connection.execute("PRAGMA synchronous=NORMAL")
+            _connection.execute(
+                "CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, payload BLOB)"
+            )
+        except (OSError, sqlite3.Error):
+            _connection = None
+            _unavailable = True
+    return _connection
+
+
+def load(digest: str):
+    """
+    Looks up a cached summary by content digest.
+
+    Args:
+        digest (str): The SHA-256 hex digest of the file contents.
+
+    Returns:
+        The deserialized summary, or None on a cache miss.
+    """
+    connection = _connect()
+    if connection is None:
+        return None
+    row = connection.execute(
+        "SELECT payload FROM summaries WHERE key = ?",
+        (f"{_SCHEMA_VERSION}:{digest}",),
+    ).fetchone()
+    if row is None:
+        return None
+    return json.loads(row[0])
+
+
+def store(digest: str, summary) -> None:
+    """
+    Stores a summary under the given content digest.
+
+    Args:
+        digest (str): The SHA-256 hex digest of the file contents.
+        summary: A JSON-serializable summary to cache.
+    """
+    connection = _connect()
+    if connection is None:
+        return
+    connection.execute(
+        "INSERT OR REPLACE INTO summaries (key, payload) VALUES (?, ?)",
+        (f"{_SCHEMA_VERSION}:{digest}", json.dumps(summary)),
+    )
+    connection.commit()
@@ -6,78 +6,75 @@ The outline is determined by the classes and functions found in the file.
 
 """
 
+CLASS_TPL = "{decorators}  Class: {name}{bases}\n\n{attributes}{methods}"
+"""One class block: decorator lines, header, attribute lines, method blocks."""
 
-def format_class(
-    class_data: dict, minimalistic: bool, no_attributes: bool
-) -> list[str]:
-    class_output = []
+METHOD_TPL = "{decorators}    Method: {name}({args}){return_type}\n\n"
+METHOD_TPL_MIN = "{decorators}    {name}({args}){return_type}\n\n"
+"""One method block, normal and minimalistic variants."""
 
-    class_name = class_data["name"]
-    class_decorators = class_data["decorators"]
-    class_attributes = class_data["attributes"]
-    class_base_classes = class_data["base_classes"]
+FUNCTION_TPL = "{decorators}  Function: {name}({args}){return_type}\n\n"
+FUNCTION_TPL_MIN = "{decorators}    {name}({args}){return_type}\n\n"
+"""One top-level function block, normal and minimalistic variants."""
+
+
+def _decorators_block(decorators: list, first_prefix: str, rest_prefix: str) -> str:
+    if not decorators:
+        return ""
+    return f"{first_prefix}{decorators[0]}\n" + "".join(
+        f"{rest_prefix}{decorator}\n" for decorator in decorators[1:]
+    )
 
-    if class_decorators:
-        for decorator in class_decorators:
-            class_output.append(f"  @{decorator}")
 
-    class_full_name = f"  Class: {class_name}"
-    if class_base_classes:
-        class_full_name += " (" + ", ".join(class_base_classes) + ")"
-    class_output.append(class_full_name)
-    class_output.append("")
+def format_class(class_data: dict, minimalistic: bool, no_attributes: bool) -> str:
+    class_attributes = class_data["attributes"]
 
     if not no_attributes and class_attributes:
-        for attribute in class_attributes:
-            attr_type = f": {attribute['type']}" if attribute["type"] else ""
-            class_output.append(f"    {attribute['name']}{attr_type}")
-        class_output.append("")
-
-    for method in class_data["methods"]:
-        decorators_output = []
-        if method["decorators"]:
-            for i, decorator in enumerate(method["decorators"]):
-                prefix = "    " if i == 0 else "    |"
-                decorators_output.append(f"{prefix}@{decorator}")
-        args = ", ".join(
-            f"{name}: {hint}" if hint else name for name, hint in method["args"]
+        attributes = (
+            "".join(
+                (
+                    f"    {attribute.name}: {attribute.type}\n"
+                    if attribute.type
+                    else f"    {attribute.name}\n"
+                )
+                for attribute in class_attributes
+            )
+            + "\n"
         )
-        return_type = f" -> {method['return_type']}" if method["return_type"] else ""
-        method_output = (
-            f"    {method['name']}({args}){return_type}"
-            if minimalistic
-            else f"    Method: {method['name']}({args}){return_type}"
+    else:
+        attributes = ""
+
+    method_template = METHOD_TPL_MIN if minimalistic else METHOD_TPL
+    methods = "".join(
+        method_template.format(
+            decorators=_decorators_block(method.decorators, "    @", "    |@"),
+            name=method.name,
+            args=method.args_str,
+            return_type=f" -> {method.return_type}" if method.return_type else "",
         )
-        if decorators_output:
-            class_output.append("\n".join(decorators_output))
-        class_output.append(method_output)
-        class_output.append("")
-    return class_output
-
-
-def format_function(function_data: dict, minimalistic: bool) -> list[str]:
-    function_output = []
-    decorators_output = []
-    if function_data["decorators"]:
-        for i, decorator in enumerate(function_data["decorators"]):
-            prefix = "   " if i == 0 else "  |"
-            decorators_output.append(f"{prefix}@{decorator}")
-    args = ", ".join(
-        f"{name}: {hint}" if hint else name for name, hint in function_data["args"]
+        for method in class_data["methods"]
     )
-    return_type = (
-        f" -> {function_data['return_type']}" if function_data["return_type"] else ""
+
+    base_classes = class_data["base_classes"]
+    return CLASS_TPL.format(
+        decorators=_decorators_block(class_data["decorators"], "  @", "  @"),
+        name=class_data["name"],
+        bases=f" ({', '.join(base_classes)})" if base_classes else "",
+        attributes=attributes,
+        methods=methods,
     )
-    function_string = (
-        f"    {function_data['name']}({args}){return_type}"
-        if minimalistic
-        else f"  Function: {function_data['name']}({args}){return_type}"
+
+
+def format_function(function_data, minimalistic: bool) -> str:
+    template = FUNCTION_TPL_MIN if minimalistic else FUNCTION_TPL
+    return template.format(
+        decorators=_decorators_block(function_data.decorators, "   @", "  |@"),
+        name=function_data.name,
+        args=function_data.args_str,
+        return_type=(
+            f" -> {function_data.return_type}" if function_data.return_type else ""
+        ),
     )
-    if decorators_output:
-        function_output.append("\n".join(decorators_output))
-    function_output.append(function_string)
-    function_output.append("")
-    return function_output
 
 
 def format_output(
@@ -95,34 +92,35 @@ def format_output(
     Args:
         filepath (str): The path to the file being outlined.
         classes (list): A list of dictionaries containing information about the classes
-            in the file. Each dictionary should contain the keys "name", "decorators", "attributes",
-            and "methods".
-        functions (list): A list of dictionaries containing information about the functions
-            in the file. Each dictionary should contain the keys "name", "decorators", and "args".
+            in the file. Each dictionary should contain the keys "name", "decorators",
+            "base_classes", "attributes" (a list of Attribute records), and
+            "methods" (a list of Method records).
+        functions (list): A list of Method records describing the top-level
+            functions in the file.
         include_classes (bool): Whether or not to include classes in the output.
         include_functions (bool): Whether or not to include functions in the output.
         minimalistic (bool): Whether to use a minimalistic output style or not.
         no_attributes (bool): Whether to ignore class attributes from the output.
 
     Returns:
-        str: The formatted string representing the outline of the file.
+        list[str]: Newline-terminated string fragments representing the outline
+            of the file, suitable for `writelines`. Empty when there is nothing
+            to emit for the file.
     """
-    output = []
-    if (include_classes and classes) or (include_functions and functions):
-        output.append(f"=== {filepath}: ===")
-        output.append("")
-
-        if include_classes and classes:
-            for class_data in classes:
-                class_output = format_class(class_data, minimalistic, no_attributes)
-                output.extend(class_output)
-
-        if include_functions and functions:
-            if minimalistic:
-                output.append("  Functions:\n")
-            for function_data in functions:
-                function_output = format_function(function_data, minimalistic)
-                output.extend(function_output)
-            output.append("")
-        output.append("")
-    return "\n".join(output)
+    if not (include_classes and classes) and not (include_functions and functions):
+        return []
+
+    output = [f"=== {filepath}: ===\n\n"]
+
+    if include_classes and classes:
+        for class_data in classes:
+            output.append(format_class(class_data, minimalistic, no_attributes))
+
+    if include_functions and functions:
+        if minimalistic:
+            output.append("  Functions:\n\n")
+        for function_data in functions:
+            output.append(format_function(function_data, minimalistic))
+        output.append("\n")
+    output.append("\n")
+    return output